@@ -35,115 +35,35 @@ Or use the convenience function:
     >>> audio.play("test.pd", ".", duration_ms=4000)
 """
 
-from cypd._libpd import (
-    # Initialization
-    init,
-    init_audio,
-    init_hooks,
-    release,
+# Public names are resolved lazily (PEP 562): importing cypd no longer pays
+# for materializing the full _libpd function table or initializing the
+# miniaudio backend, only for what is actually used. Resolved names are
+# cached in the module globals, so each lookup happens at most once.
 
-    # Patch management
-    open_patch,
-    close_patch,
+_LIBPD_NAMES = None  # frozenset of names served by cypd._libpd, built on demand
 
-    # Search path
-    clear_search_path,
-    add_to_search_path,
-
-    # Audio processing
-    get_blocksize,
-    dsp,
-
-    # Sending messages to pd
-    send_bang,
-    send_float,
-    send_symbol,
-    send_list,
-    send_message,
-
-    # Compound message building
-    start_message,
-    add_float,
-    add_symbol,
-    finish_list,
-    finish_message,
-
-    # Receiving messages from pd (subscriptions)
-    subscribe,
-    unsubscribe,
-    exists,
 
-    # Message callbacks
-    set_print_callback,
-    set_bang_callback,
-    set_float_callback,
-    set_double_callback,
-    set_symbol_callback,
-    set_list_callback,
-    set_message_callback,
-
-    # Array access
-    array_size,
-    resize_array,
-
-    # MIDI output (to pd)
-    noteon,
-    controlchange,
-    programchange,
-    pitchbend,
-    aftertouch,
-    polyaftertouch,
-    midibyte,
-    sysex,
-    sysrealtime,
-
-    # MIDI callbacks (from pd)
-    set_noteon_callback,
-    set_controlchange_callback,
-    set_programchange_callback,
-    set_pitchbend_callback,
-    set_aftertouch_callback,
-    set_polyaftertouch_callback,
-    set_midibyte_callback,
+def __getattr__(name):
+    global _LIBPD_NAMES
+    if name == "audio":
+        from cypd import _audio as audio
+        globals()["audio"] = audio
+        return audio
+    if _LIBPD_NAMES is None:
+        _LIBPD_NAMES = frozenset(__all__) - {"audio"}
+    if name in _LIBPD_NAMES:
+        from cypd import _libpd
+        value = getattr(_libpd, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module 'cypd' has no attribute {name!r}")
 
-    # GUI
-    start_gui,
-    stop_gui,
-    poll_gui,
 
-    # Multiple instances
-    num_instances,
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
-    # Logging
-    get_verbose,
-    set_verbose,
-    pd_version,
-
-    # Queued API (thread-safe message passing)
-    queued_init,
-    queued_release,
-    queued_receive_pd_messages,
-    queued_receive_midi_messages,
-    set_queued_print_callback,
-    set_queued_bang_callback,
-    set_queued_float_callback,
-    set_queued_double_callback,
-    set_queued_symbol_callback,
-    set_queued_list_callback,
-    set_queued_message_callback,
-    set_queued_noteon_callback,
-    set_queued_controlchange_callback,
-    set_queued_programchange_callback,
-    set_queued_pitchbend_callback,
-    set_queued_aftertouch_callback,
-    set_queued_polyaftertouch_callback,
-    set_queued_midibyte_callback,
-)
 
-# Import audio module (miniaudio backend)
-from cypd import _audio as audio
-
-__all__ = [
+__all__ = (
     # Submodules
     "audio",
 
@@ -164,13 +84,16 @@ __all__ = [
     # Audio
     "get_blocksize",
     "dsp",
+    "process_float",
 
     # Messages to pd
     "send_bang",
     "send_float",
     "send_symbol",
     "send_list",
+    "send_list_fast",
     "send_message",
+    "Sender",
     "start_message",
     "add_float",
     "add_symbol",
@@ -229,6 +152,7 @@ __all__ = [
     # Queued API
     "queued_init",
     "queued_release",
+    "queued_receive",
     "queued_receive_pd_messages",
     "queued_receive_midi_messages",
     "set_queued_print_callback",
@@ -245,6 +169,6 @@ __all__ = [
     "set_queued_aftertouch_callback",
     "set_queued_polyaftertouch_callback",
     "set_queued_midibyte_callback",
-]
+)
 
 __version__ = "0.1.0"
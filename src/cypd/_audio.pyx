@@ -234,7 +234,9 @@ def start() -> bool:
     if not g_device_initialized:
         return False
 
-    cdef ma.ma_result result = ma.ma_device_start(&g_device)
+    cdef ma.ma_result result
+    with nogil:
+        result = ma.ma_device_start(&g_device)
     if result != ma.MA_SUCCESS:
         return False
 
@@ -255,7 +257,9 @@ def stop() -> bool:
 
     g_audio_state.is_running = False
 
-    cdef ma.ma_result result = ma.ma_device_stop(&g_device)
+    cdef ma.ma_result result
+    with nogil:
+        result = ma.ma_device_stop(&g_device)
     return result == ma.MA_SUCCESS
 
 
@@ -294,10 +298,14 @@ def terminate():
 def sleep(int milliseconds):
     """Sleep for the specified number of milliseconds.
 
-    Uses Python's time.sleep for cross-platform compatibility.
+    Releases the GIL while sleeping so the audio callback and any other
+    Python threads never contend with the sleeping thread.
+    Raises ValueError for negative durations.
     """
-    import time
-    time.sleep(milliseconds / 1000.0)
+    if milliseconds < 0:
+        raise ValueError("sleep length must be non-negative")
+    with nogil:
+        ma.ma_sleep_ms(<unsigned int>milliseconds)
 
 
 # ----------------------------------------------------------------------------
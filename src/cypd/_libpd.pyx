@@ -6,11 +6,16 @@ This module provides a functional API to libpd without any audio backend.
 Users can integrate their own audio I/O (miniaudio, portaudio, etc.) and
 call the process_* functions from their audio callback.
 """
+cimport cython
+
 cimport pd
 cimport libpd
 
 from libc.stdlib cimport malloc, free
 from libc.stdint cimport uintptr_t
+from libc.string cimport strlen
+
+from cpython.unicode cimport PyUnicode_FromStringAndSize
 
 # ----------------------------------------------------------------------------
 # pure python callbacks (default handlers for testing/debugging)
@@ -48,28 +53,32 @@ def init_hooks():
 # ----------------------------------------------------------------------------
 # message and midi callback slots
 
-CALLBACKS = dict(
-    # message callbacks
-    print_callback = None,
-    bang_callback = None,
-    float_callback = None,
-    double_callback = None,
-    symbol_callback = None,
-    list_callback = None,
-    message_callback = None,
-
-    # midi callbacks
-    noteon_callback = None,
-    controlchange_callback = None,
-    programchange_callback = None,
-    pitchbend_callback = None,
-    aftertouch_callback = None,
-    polyaftertouch_callback = None,
-    midibyte_callback = None,
-)
+# Callbacks live in typed module-level slots rather than a dict so the
+# trampolines below dispatch with a single pre-resolved C global load
+# instead of a dict lookup on every message from the audio thread.
+
+# message callbacks
+cdef object _print_callback = None
+cdef object _bang_callback = None
+cdef object _float_callback = None
+cdef object _double_callback = None
+cdef object _symbol_callback = None
+cdef object _list_callback = None
+cdef object _message_callback = None
+
+# midi callbacks
+cdef object _noteon_callback = None
+cdef object _controlchange_callback = None
+cdef object _programchange_callback = None
+cdef object _pitchbend_callback = None
+cdef object _aftertouch_callback = None
+cdef object _polyaftertouch_callback = None
+cdef object _midibyte_callback = None
 
 __LIBPD_PATCHES = {}
 __LIBPD_SUBSCRIPTIONS = {}
+__LIBPD_RECV_CACHE = {}
+DEF RECV_CACHE_MAX = 1024  # oldest entry is evicted once the cache is full
 
 # ----------------------------------------------------------------------------
 # callback hooks (C-level trampolines to Python callbacks)
@@ -80,77 +89,80 @@ __LIBPD_SUBSCRIPTIONS = {}
 
 # messaging
 cdef void print_callback_hook(const char *s) noexcept nogil:
+    # length is measured before taking the GIL so the unicode object can be
+    # built in one sized allocation instead of a scanning decode
+    cdef Py_ssize_t n = <Py_ssize_t>strlen(s)
     with gil:
-        if CALLBACKS['print_callback']:
-            CALLBACKS['print_callback'](s.decode())
+        if _print_callback is not None:
+            _print_callback(PyUnicode_FromStringAndSize(s, n))
 
 cdef void bang_callback_hook(const char *recv) noexcept nogil:
     with gil:
-        if CALLBACKS['bang_callback']:
-            CALLBACKS['bang_callback'](recv.decode())
+        if _bang_callback is not None:
+            _bang_callback(recv.decode())
 
 cdef void float_callback_hook(const char *recv, float f) noexcept nogil:
     with gil:
-        if CALLBACKS['float_callback']:
-            CALLBACKS['float_callback'](recv.decode(), f)
+        if _float_callback is not None:
+            _float_callback(recv.decode(), f)
 
 cdef void double_callback_hook(const char *recv, double d) noexcept nogil:
     with gil:
-        if CALLBACKS['double_callback']:
-            CALLBACKS['double_callback'](recv.decode(), d)
+        if _double_callback is not None:
+            _double_callback(recv.decode(), d)
 
 cdef void symbol_callback_hook(const char *recv, const char *symbol) noexcept nogil:
     with gil:
-        if CALLBACKS['symbol_callback']:
-            CALLBACKS['symbol_callback'](recv.decode(), symbol.decode())
+        if _symbol_callback is not None:
+            _symbol_callback(recv.decode(), symbol.decode())
 
 cdef void list_callback_hook(const char *recv, int argc, pd.t_atom *argv) noexcept nogil:
     with gil:
-        if CALLBACKS['list_callback']:
+        if _list_callback is not None:
             args = convert_args(recv, NULL, argc, argv)
-            CALLBACKS['list_callback'](*args)
+            _list_callback(*args)
 
 cdef void message_callback_hook(const char *recv, const char *symbol, int argc, pd.t_atom *argv) noexcept nogil:
     with gil:
-        if CALLBACKS['message_callback']:
+        if _message_callback is not None:
             args = convert_args(recv, symbol, argc, argv)
-            CALLBACKS['message_callback'](*args)
+            _message_callback(*args)
 
 # midi
 cdef void noteon_callback_hook(int channel, int pitch, int velocity) noexcept nogil:
     with gil:
-        if CALLBACKS['noteon_callback']:
-            CALLBACKS['noteon_callback'](channel, pitch, velocity)
+        if _noteon_callback is not None:
+            _noteon_callback(channel, pitch, velocity)
 
 cdef void controlchange_callback_hook(int channel, int controller, int value) noexcept nogil:
     with gil:
-        if CALLBACKS['controlchange_callback']:
-            CALLBACKS['controlchange_callback'](channel, controller, value)
+        if _controlchange_callback is not None:
+            _controlchange_callback(channel, controller, value)
 
 cdef void programchange_callback_hook(int channel, int value) noexcept nogil:
     with gil:
-        if CALLBACKS['programchange_callback']:
-            CALLBACKS['programchange_callback'](channel, value)
+        if _programchange_callback is not None:
+            _programchange_callback(channel, value)
 
 cdef void pitchbend_callback_hook(int channel, int value) noexcept nogil:
     with gil:
-        if CALLBACKS['pitchbend_callback']:
-            CALLBACKS['pitchbend_callback'](channel, value)
+        if _pitchbend_callback is not None:
+            _pitchbend_callback(channel, value)
 
 cdef void aftertouch_callback_hook(int channel, int value) noexcept nogil:
     with gil:
-        if CALLBACKS['aftertouch_callback']:
-            CALLBACKS['aftertouch_callback'](channel, value)
+        if _aftertouch_callback is not None:
+            _aftertouch_callback(channel, value)
 
 cdef void polyaftertouch_callback_hook(int channel, int pitch, int value) noexcept nogil:
     with gil:
-        if CALLBACKS['polyaftertouch_callback']:
-            CALLBACKS['polyaftertouch_callback'](channel, pitch, value)
+        if _polyaftertouch_callback is not None:
+            _polyaftertouch_callback(channel, pitch, value)
 
 cdef void midibyte_callback_hook(int port, int byte) noexcept nogil:
     with gil:
-        if CALLBACKS['midibyte_callback']:
-            CALLBACKS['midibyte_callback'](port, byte)
+        if _midibyte_callback is not None:
+            _midibyte_callback(port, byte)
 
 # ----------------------------------------------------------------------------
 # helper functions
@@ -160,6 +172,7 @@ cdef convert_args(const char *recv, const char *symbol, int argc, pd.t_atom *arg
     cdef list result = []
     cdef pd.t_atom* a
     cdef object pval = None
+    cdef int i
 
     result.append(recv.decode())
     if symbol:
@@ -167,7 +180,7 @@ cdef convert_args(const char *recv, const char *symbol, int argc, pd.t_atom *arg
 
     if argc > 0:
         for i in range(argc):
-            a = &argv[<int>i]
+            a = &argv[i]
             if is_float(a):
                 pval = <float>get_float(a)
             elif is_symbol(a):
@@ -175,6 +188,41 @@ cdef convert_args(const char *recv, const char *symbol, int argc, pd.t_atom *arg
             result.append(pval)
     return tuple(result)
 
+cdef bytes encode_recv(recv):
+    """Return the cached utf-8 encoding of a receiver name.
+
+    Receiver names are typically sent to repeatedly, so the str -> bytes
+    conversion is paid once per name instead of once per call. The cache
+    is capped at RECV_CACHE_MAX entries with oldest-first eviction so
+    one-shot names (e.g. $0-prefixed receivers from short-lived patches)
+    cannot grow it without bound.
+    """
+    cdef bytes _recv
+    try:
+        return __LIBPD_RECV_CACHE[recv]
+    except KeyError:
+        _recv = recv.encode('utf-8')
+        if len(__LIBPD_RECV_CACHE) >= RECV_CACHE_MAX:
+            del __LIBPD_RECV_CACHE[next(iter(__LIBPD_RECV_CACHE))]
+        __LIBPD_RECV_CACHE[recv] = _recv
+        return _recv
+
+cdef int build_atoms(pd.t_atom *vec, object args) except -3:
+    """Fill a pre-allocated t_atom vector from Python args.
+
+    Returns 0 on success or -1 if an arg is neither a number nor a str.
+    """
+    cdef int i = 0
+    for arg in args:
+        if isinstance(arg, str):
+            libpd.libpd_set_symbol(&vec[i], arg.encode('utf-8'))
+        elif isinstance(arg, (int, float)):
+            libpd.libpd_set_float(&vec[i], arg)
+        else:
+            return -1
+        i += 1
+    return 0
+
 def process_args(args):
     """Process Python args into libpd message atoms."""
     if libpd.libpd_start_message(len(args)):
@@ -251,6 +299,12 @@ def get_blocksize() -> int:
     """
     return libpd.libpd_blocksize()
 
+# Channel counts negotiated by the last successful init_audio(), used by
+# process_float() to validate caller-owned buffer sizes. 0 until init_audio
+# has been called.
+cdef int _in_channels = 0
+cdef int _out_channels = 0
+
 def init_audio(int in_channels, int out_channels, int sample_rate) -> bool:
     """Initialize audio rendering.
 
@@ -261,26 +315,61 @@ def init_audio(int in_channels, int out_channels, int sample_rate) -> bool:
 
     Returns True on success.
     """
-    return libpd.libpd_init_audio(in_channels, out_channels, sample_rate) == 0
+    global _in_channels, _out_channels
+    cdef int rc
+    with nogil:
+        rc = libpd.libpd_init_audio(in_channels, out_channels, sample_rate)
+    if rc == 0:
+        _in_channels = in_channels
+        _out_channels = out_channels
+    return rc == 0
 
 def dsp(on=True):
     """Turn DSP processing on or off."""
     cdef int val = 1 if on else 0
-    start_message(1)
-    add_float(val)
-    finish_message("pd", "dsp")
-
-# Low-level process functions (for use in audio callbacks)
-# These are cdef functions - call from Cython code in your audio backend
-
-cdef int process_float(const int ticks, const float *in_buffer, float *out_buffer) noexcept nogil:
+    with nogil:
+        if libpd.libpd_start_message(1) == 0:
+            libpd.libpd_add_float(val)
+            libpd.libpd_finish_message("pd", "dsp")
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.embedsignature(False)
+def process_float(int ticks, const float[::1] in_buffer, float[::1] out_buffer not None) -> int:
     """Process interleaved float samples from in_buffer -> libpd -> out_buffer.
 
-    Buffer sizes are based on # of ticks and channels where:
-        size = ticks * libpd_blocksize() * (in/out)channels
+    Operates directly on any contiguous float32 buffers (array.array('f'),
+    numpy arrays, etc.) without copying. Buffer sizes are based on # of
+    ticks and channels where:
+        size = ticks * get_blocksize() * (in/out)channels
+    in_buffer may be None for output-only processing.
+    Raises ValueError if either buffer cannot hold
+    ticks * get_blocksize() * channels floats, using the channel counts
+    negotiated by the last successful init_audio() (assumed 1 before any
+    init_audio() call).
     Returns 0 on success.
     """
-    return libpd.libpd_process_float(ticks, in_buffer, out_buffer)
+    cdef const float *inp = NULL
+    cdef int rc
+    cdef Py_ssize_t frames = ticks * libpd.libpd_blocksize()
+    cdef int in_ch = _in_channels if _in_channels > 0 else 1
+    cdef int out_ch = _out_channels if _out_channels > 0 else 1
+    if out_buffer.shape[0] < frames * out_ch:
+        raise ValueError(
+            "out_buffer too small: need at least"
+            " ticks * get_blocksize() * out_channels floats")
+    if in_buffer is not None and in_buffer.shape[0] > 0:
+        if in_buffer.shape[0] < frames * in_ch:
+            raise ValueError(
+                "in_buffer too small: need at least"
+                " ticks * get_blocksize() * in_channels floats")
+        inp = &in_buffer[0]
+    with nogil:
+        rc = libpd.libpd_process_float(ticks, inp, &out_buffer[0])
+    return rc
+
+# Low-level process functions (for use in audio callbacks)
+# These are cdef functions - call from Cython code in your audio backend
 
 # Exported function for _audio module to use (ensures same libpd instance)
 cdef int process_float_ticks(int ticks, float *in_buffer, float *out_buffer) noexcept nogil:
@@ -341,31 +430,31 @@ cdef int process_raw_double(const double *in_buffer, double *out_buffer) noexcep
 # ----------------------------------------------------------------------------
 # Atom operations (cdef - for Cython code)
 
-cdef bint is_float(pd.t_atom *a):
+cdef inline bint is_float(pd.t_atom *a) noexcept nogil:
     """Check if an atom is a float type."""
     return libpd.libpd_is_float(a)
 
-cdef bint is_symbol(pd.t_atom *a):
+cdef inline bint is_symbol(pd.t_atom *a) noexcept nogil:
     """Check if an atom is a symbol type."""
     return libpd.libpd_is_symbol(a)
 
-cdef void set_float(pd.t_atom *a, float x):
+cdef inline void set_float(pd.t_atom *a, float x) noexcept nogil:
     """Write a float value to the given atom."""
     libpd.libpd_set_float(a, x)
 
-cdef float get_float(pd.t_atom *a):
+cdef inline float get_float(pd.t_atom *a) noexcept nogil:
     """Get the float value of an atom."""
     return libpd.libpd_get_float(a)
 
-cdef void set_symbol(pd.t_atom *a, const char *symbol):
+cdef inline void set_symbol(pd.t_atom *a, const char *symbol) noexcept nogil:
     """Write a symbol value to the given atom."""
     libpd.libpd_set_symbol(a, symbol)
 
-cdef const char *get_symbol(pd.t_atom *a):
+cdef inline const char *get_symbol(pd.t_atom *a) noexcept nogil:
     """Get symbol value of an atom."""
     return libpd.libpd_get_symbol(a)
 
-cdef pd.t_atom *next_atom(pd.t_atom *a):
+cdef inline pd.t_atom *next_atom(pd.t_atom *a) noexcept nogil:
     """Increment to the next atom in an atom vector."""
     return libpd.libpd_next_atom(a)
 
@@ -403,7 +492,7 @@ def send_bang(recv) -> bool:
     Ex: send_bang("foo") will send a bang to [s foo] on the next tick.
     Returns True on success, False if receiver name is non-existent.
     """
-    cdef bytes _recv = recv.encode()
+    cdef bytes _recv = encode_recv(recv)
     return libpd.libpd_bang(_recv) == 0
 
 def send_float(recv, float x) -> bool:
@@ -412,7 +501,7 @@ def send_float(recv, float x) -> bool:
     Ex: send_float("foo", 1.0) will send 1.0 to [s foo] on the next tick.
     Returns True on success, False if receiver name is non-existent.
     """
-    cdef bytes _recv = recv.encode()
+    cdef bytes _recv = encode_recv(recv)
     return libpd.libpd_float(_recv, x) == 0
 
 def send_symbol(recv, symbol) -> bool:
@@ -421,7 +510,7 @@ def send_symbol(recv, symbol) -> bool:
     Ex: send_symbol("foo", "bar") will send "bar" to [s foo] on the next tick.
     Returns True on success, False if receiver name is non-existent.
     """
-    cdef bytes _recv = recv.encode()
+    cdef bytes _recv = encode_recv(recv)
     cdef bytes _symbol = symbol.encode()
     return libpd.libpd_symbol(_recv, _symbol) == 0
 
@@ -447,19 +536,70 @@ def add_symbol(symbol):
     libpd.libpd_add_symbol(_symbol)
 
 def send_list(recv, *args):
-    """Send an atom array as a list to a destination receiver."""
-    return process_args(args) or finish_list(recv)
+    """Send an atom array as a list to a destination receiver.
+
+    The t_atom vector is built in a single pass and handed to libpd_list,
+    instead of sequencing one libpd_add_* call per element.
+    """
+    cdef bytes _recv = encode_recv(recv)
+    cdef int argc = <int>len(args)
+    cdef pd.t_atom *vec = <pd.t_atom*>malloc(max(argc, 1) * sizeof(pd.t_atom))
+    if vec == NULL:
+        raise MemoryError()
+    try:
+        if build_atoms(vec, args):
+            return -1
+        return libpd.libpd_list(_recv, argc, vec) == 0
+    finally:
+        free(vec)
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.embedsignature(False)
+def send_list_fast(recv, const double[::1] values not None) -> bool:
+    """Send a list of floats to a destination receiver from a typed buffer.
+
+    Accepts any contiguous buffer of doubles (array.array('d', ...),
+    numpy arrays, etc.) and builds the message without per-element Python
+    object conversion.
+    Returns True on success, False if receiver name is non-existent.
+    """
+    cdef bytes _recv = encode_recv(recv)
+    cdef const char *c_recv = _recv
+    cdef Py_ssize_t i, n = values.shape[0]
+    cdef int rc
+    with nogil:
+        rc = libpd.libpd_start_message(<int>n)
+        if rc == 0:
+            for i in range(n):
+                libpd.libpd_add_float(<float>values[i])
+            rc = libpd.libpd_finish_list(c_recv)
+    return rc == 0
 
 def send_message(recv, symbol, *args):
-    """Send an atom array as a typed message to a destination receiver."""
-    return process_args(args) or finish_message(recv, symbol)
+    """Send an atom array as a typed message to a destination receiver.
+
+    Note: typed message handling currently only supports up to 4 elements.
+    """
+    cdef bytes _recv = encode_recv(recv)
+    cdef bytes _symbol = symbol.encode('utf-8')
+    cdef int argc = <int>len(args)
+    cdef pd.t_atom *vec = <pd.t_atom*>malloc(max(argc, 1) * sizeof(pd.t_atom))
+    if vec == NULL:
+        raise MemoryError()
+    try:
+        if build_atoms(vec, args):
+            return -1
+        return libpd.libpd_message(_recv, _symbol, argc, vec) == 0
+    finally:
+        free(vec)
 
 def finish_list(recv: str) -> bool:
     """Finish current message and send as a list to a destination receiver.
 
     Returns True on success, False if receiver name is non-existent.
     """
-    return libpd.libpd_finish_list(recv.encode('utf-8')) == 0
+    return libpd.libpd_finish_list(encode_recv(recv)) == 0
 
 def finish_message(recv: str, msg: str) -> bool:
     """Finish current message and send as a typed message.
@@ -467,7 +607,56 @@ def finish_message(recv: str, msg: str) -> bool:
     Note: typed message handling currently only supports up to 4 elements.
     Returns True on success, False if receiver name is non-existent.
     """
-    return libpd.libpd_finish_message(recv.encode('utf-8'), msg.encode('utf-8')) == 0
+    return libpd.libpd_finish_message(encode_recv(recv), msg.encode('utf-8')) == 0
+
+# ----------------------------------------------------------------------------
+# Fast-path sending to a single receiver
+
+cdef class Sender:
+    """Pre-bound fast path for sending to a single receiver.
+
+    Encodes the receiver name once at construction, so repeated sends skip
+    the per-call str -> bytes conversion and cache lookup entirely:
+
+        metro = Sender("metro")
+        metro.float(120.0)
+        metro.bang()
+    """
+    cdef bytes _recv
+
+    def __cinit__(self, recv):
+        self._recv = recv.encode('utf-8')
+
+    @property
+    def receiver(self) -> str:
+        """The receiver name this sender is bound to."""
+        return self._recv.decode()
+
+    def bang(self) -> bool:
+        """Send a bang to the bound receiver."""
+        return libpd.libpd_bang(self._recv) == 0
+
+    def float(self, float x) -> bool:
+        """Send a float to the bound receiver."""
+        return libpd.libpd_float(self._recv, x) == 0
+
+    def symbol(self, symbol) -> bool:
+        """Send a symbol to the bound receiver."""
+        cdef bytes _symbol = symbol.encode('utf-8')
+        return libpd.libpd_symbol(self._recv, _symbol) == 0
+
+    def list(self, const double[::1] values not None) -> bool:
+        """Send a list of floats to the bound receiver from a typed buffer."""
+        cdef const char *c_recv = self._recv
+        cdef Py_ssize_t i, n = values.shape[0]
+        cdef int rc
+        with nogil:
+            rc = libpd.libpd_start_message(<int>n)
+            if rc == 0:
+                for i in range(n):
+                    libpd.libpd_add_float(<float>values[i])
+                rc = libpd.libpd_finish_list(c_recv)
+        return rc == 0
 
 # ----------------------------------------------------------------------------
 # Receiving messages from pd
@@ -513,33 +702,36 @@ def set_print_callback(callback):
 
     Note: do not call this while DSP is running.
     """
+    global _print_callback
     if callable(callback):
-        CALLBACKS['print_callback'] = callback
+        _print_callback = callback
         libpd.libpd_set_printhook(print_callback_hook)
     else:
-        CALLBACKS['print_callback'] = None
+        _print_callback = None
 
 def set_bang_callback(callback):
     """Set the bang receiver callback, NULL by default.
 
     Note: do not call this while DSP is running.
     """
+    global _bang_callback
     if callable(callback):
-        CALLBACKS['bang_callback'] = callback
+        _bang_callback = callback
         libpd.libpd_set_banghook(bang_callback_hook)
     else:
-        CALLBACKS['bang_callback'] = None
+        _bang_callback = None
 
 def set_float_callback(callback):
     """Set the float receiver callback, NULL by default.
 
     Note: do not call this while DSP is running.
     """
+    global _float_callback
     if callable(callback):
-        CALLBACKS['float_callback'] = callback
+        _float_callback = callback
         libpd.libpd_set_floathook(float_callback_hook)
     else:
-        CALLBACKS['float_callback'] = None
+        _float_callback = None
 
 def set_double_callback(callback):
     """Set the double receiver callback, NULL by default.
@@ -547,89 +739,118 @@ def set_double_callback(callback):
     Note: do not call this while DSP is running.
     Note: you can have either a double or float receiver hook, not both.
     """
+    global _double_callback
     if callable(callback):
-        CALLBACKS['double_callback'] = callback
+        _double_callback = callback
         libpd.libpd_set_doublehook(double_callback_hook)
     else:
-        CALLBACKS['double_callback'] = None
+        _double_callback = None
 
 def set_symbol_callback(callback):
     """Set the symbol receiver callback, NULL by default.
 
     Note: do not call this while DSP is running.
     """
+    global _symbol_callback
     if callable(callback):
-        CALLBACKS['symbol_callback'] = callback
+        _symbol_callback = callback
         libpd.libpd_set_symbolhook(symbol_callback_hook)
     else:
-        CALLBACKS['symbol_callback'] = None
+        _symbol_callback = None
 
 def set_list_callback(callback):
     """Set the list receiver callback, NULL by default.
 
     Note: do not call this while DSP is running.
     """
+    global _list_callback
     if callable(callback):
-        CALLBACKS['list_callback'] = callback
+        _list_callback = callback
         libpd.libpd_set_listhook(list_callback_hook)
     else:
-        CALLBACKS['list_callback'] = None
+        _list_callback = None
 
 def set_message_callback(callback):
     """Set the message receiver callback, NULL by default.
 
     Note: do not call this while DSP is running.
     """
+    global _message_callback
     if callable(callback):
-        CALLBACKS['message_callback'] = callback
+        _message_callback = callback
         libpd.libpd_set_messagehook(message_callback_hook)
     else:
-        CALLBACKS['message_callback'] = None
+        _message_callback = None
 
 # ----------------------------------------------------------------------------
 # Sending MIDI messages to pd
 
-def noteon(channel: int, pitch: int, velocity: int) -> bool:
+cdef inline int clamp_midi(int v, int hi) noexcept nogil:
+    """Branchless clamp of v to 0..hi (hi is 127 for MIDI data bytes).
+
+    v & ~(v >> 31) is max(v, 0) without a compare, applied twice around a
+    reflection about hi to also give min(v, hi).
+    """
+    v &= ~(v >> 31)
+    v = hi - v
+    v &= ~(v >> 31)
+    return hi - v
+
+def noteon(int channel, int pitch, int velocity) -> bool:
     """Send a MIDI note on message to [notein] objects.
 
     channel is 0-indexed, pitch is 0-127, velocity is 0-127.
     Channels encode MIDI ports: libpd_channel = pd_channel + 16 * pd_port.
+    Out-of-range pitch/velocity are clamped to 0-127 and negative channels
+    to 0, so the send cannot be rejected for range.
     Note: there is no note off, send note on with velocity=0 instead.
     """
-    return libpd.libpd_noteon(channel, pitch, velocity) == 0
+    channel &= ~(channel >> 31)
+    return libpd.libpd_noteon(channel, clamp_midi(pitch, 127),
+                              clamp_midi(velocity, 127)) == 0
+
+def controlchange(int channel, int controller, int value) -> bool:
+    """Send a MIDI control change message to [ctlin] objects.
+
+    Out-of-range controller/value are clamped to 0-127 and negative
+    channels to 0.
+    """
+    channel &= ~(channel >> 31)
+    return libpd.libpd_controlchange(channel, clamp_midi(controller, 127),
+                                     clamp_midi(value, 127)) == 0
 
-def controlchange(channel: int, controller: int, value: int) -> bool:
-    """Send a MIDI control change message to [ctlin] objects."""
-    return libpd.libpd_controlchange(channel, controller, value) == 0
+def programchange(int channel, int value) -> bool:
+    """Send a MIDI program change message to [pgmin] objects.
 
-def programchange(channel: int, value: int) -> bool:
-    """Send a MIDI program change message to [pgmin] objects."""
-    return libpd.libpd_programchange(channel, value) == 0
+    Out-of-range values are clamped to 0-127 and negative channels to 0.
+    """
+    channel &= ~(channel >> 31)
+    return libpd.libpd_programchange(channel, clamp_midi(value, 127)) == 0
 
-def pitchbend(channel: int, value: int) -> bool:
+def pitchbend(int channel, int value) -> bool:
     """Send a MIDI pitch bend message to [bendin] objects.
 
     Value is -8192 to 8192.
     """
     return libpd.libpd_pitchbend(channel, value) == 0
 
-def aftertouch(channel: int, value: int) -> bool:
+def aftertouch(int channel, int value) -> bool:
     """Send a MIDI after touch message to [touchin] objects."""
     return libpd.libpd_aftertouch(channel, value) == 0
 
-def polyaftertouch(channel: int, pitch: int, value: int) -> bool:
+def polyaftertouch(int channel, int pitch, int value) -> bool:
     """Send a MIDI poly after touch message to [polytouchin] objects."""
     return libpd.libpd_polyaftertouch(channel, pitch, value) == 0
 
-def midibyte(port: int, byte: int) -> bool:
+def midibyte(int port, int byte) -> bool:
     """Send a raw MIDI byte to [midiin] objects."""
     return libpd.libpd_midibyte(port, byte) == 0
 
-def sysex(port: int, byte: int) -> bool:
+def sysex(int port, int byte) -> bool:
     """Send a raw MIDI byte to [sysexin] objects."""
     return libpd.libpd_sysex(port, byte) == 0
 
-def sysrealtime(port: int, byte: int) -> bool:
+def sysrealtime(int port, int byte) -> bool:
     """Send a raw MIDI byte to [realtimein] objects."""
     return libpd.libpd_sysrealtime(port, byte) == 0
 
@@ -638,59 +859,66 @@ def sysrealtime(port: int, byte: int) -> bool:
 
 def set_noteon_callback(callback):
     """Set the MIDI note on callback to receive from [noteout] objects."""
+    global _noteon_callback
     if callable(callback):
-        CALLBACKS['noteon_callback'] = callback
+        _noteon_callback = callback
         libpd.libpd_set_noteonhook(noteon_callback_hook)
     else:
-        CALLBACKS['noteon_callback'] = None
+        _noteon_callback = None
 
 def set_controlchange_callback(callback):
     """Set the MIDI control change callback to receive from [ctlout] objects."""
+    global _controlchange_callback
     if callable(callback):
-        CALLBACKS['controlchange_callback'] = callback
+        _controlchange_callback = callback
         libpd.libpd_set_controlchangehook(controlchange_callback_hook)
     else:
-        CALLBACKS['controlchange_callback'] = None
+        _controlchange_callback = None
 
 def set_programchange_callback(callback):
     """Set the MIDI program change callback to receive from [pgmout] objects."""
+    global _programchange_callback
     if callable(callback):
-        CALLBACKS['programchange_callback'] = callback
+        _programchange_callback = callback
         libpd.libpd_set_programchangehook(programchange_callback_hook)
     else:
-        CALLBACKS['programchange_callback'] = None
+        _programchange_callback = None
 
 def set_pitchbend_callback(callback):
     """Set the MIDI pitch bend callback to receive from [bendout] objects."""
+    global _pitchbend_callback
     if callable(callback):
-        CALLBACKS['pitchbend_callback'] = callback
+        _pitchbend_callback = callback
         libpd.libpd_set_pitchbendhook(pitchbend_callback_hook)
     else:
-        CALLBACKS['pitchbend_callback'] = None
+        _pitchbend_callback = None
 
 def set_aftertouch_callback(callback):
     """Set the MIDI after touch callback to receive from [touchout] objects."""
+    global _aftertouch_callback
     if callable(callback):
-        CALLBACKS['aftertouch_callback'] = callback
+        _aftertouch_callback = callback
         libpd.libpd_set_aftertouchhook(aftertouch_callback_hook)
     else:
-        CALLBACKS['aftertouch_callback'] = None
+        _aftertouch_callback = None
 
 def set_polyaftertouch_callback(callback):
     """Set the MIDI poly after touch callback to receive from [polytouchout]."""
+    global _polyaftertouch_callback
     if callable(callback):
-        CALLBACKS['polyaftertouch_callback'] = callback
+        _polyaftertouch_callback = callback
         libpd.libpd_set_polyaftertouchhook(polyaftertouch_callback_hook)
     else:
-        CALLBACKS['polyaftertouch_callback'] = None
+        _polyaftertouch_callback = None
 
 def set_midibyte_callback(callback):
     """Set the raw MIDI byte callback to receive from [midiout] objects."""
+    global _midibyte_callback
     if callable(callback):
-        CALLBACKS['midibyte_callback'] = callback
+        _midibyte_callback = callback
         libpd.libpd_set_midibytehook(midibyte_callback_hook)
     else:
-        CALLBACKS['midibyte_callback'] = None
+        _midibyte_callback = None
 
 # ----------------------------------------------------------------------------
 # GUI
@@ -764,115 +992,129 @@ def pd_version() -> str:
 
 def set_queued_print_callback(callback):
     """Set the queued print receiver callback."""
+    global _print_callback
     if callable(callback):
-        CALLBACKS['print_callback'] = callback
+        _print_callback = callback
         libpd.libpd_set_queued_printhook(print_callback_hook)
     else:
-        CALLBACKS['print_callback'] = None
+        _print_callback = None
 
 def set_queued_bang_callback(callback):
     """Set the queued bang receiver callback."""
+    global _bang_callback
     if callable(callback):
-        CALLBACKS['bang_callback'] = callback
+        _bang_callback = callback
         libpd.libpd_set_queued_banghook(bang_callback_hook)
     else:
-        CALLBACKS['bang_callback'] = None
+        _bang_callback = None
 
 def set_queued_float_callback(callback):
     """Set the queued float receiver callback."""
+    global _float_callback
     if callable(callback):
-        CALLBACKS['float_callback'] = callback
+        _float_callback = callback
         libpd.libpd_set_queued_floathook(float_callback_hook)
     else:
-        CALLBACKS['float_callback'] = None
+        _float_callback = None
 
 def set_queued_double_callback(callback):
     """Set the queued double receiver callback."""
+    global _double_callback
     if callable(callback):
-        CALLBACKS['double_callback'] = callback
+        _double_callback = callback
         libpd.libpd_set_queued_doublehook(double_callback_hook)
     else:
-        CALLBACKS['double_callback'] = None
+        _double_callback = None
 
 def set_queued_symbol_callback(callback):
     """Set the queued symbol receiver callback."""
+    global _symbol_callback
     if callable(callback):
-        CALLBACKS['symbol_callback'] = callback
+        _symbol_callback = callback
         libpd.libpd_set_queued_symbolhook(symbol_callback_hook)
     else:
-        CALLBACKS['symbol_callback'] = None
+        _symbol_callback = None
 
 def set_queued_list_callback(callback):
     """Set the queued list receiver callback."""
+    global _list_callback
     if callable(callback):
-        CALLBACKS['list_callback'] = callback
+        _list_callback = callback
         libpd.libpd_set_queued_listhook(list_callback_hook)
     else:
-        CALLBACKS['list_callback'] = None
+        _list_callback = None
 
 def set_queued_message_callback(callback):
     """Set the queued typed message receiver callback."""
+    global _message_callback
     if callable(callback):
-        CALLBACKS['message_callback'] = callback
+        _message_callback = callback
         libpd.libpd_set_queued_messagehook(message_callback_hook)
     else:
-        CALLBACKS['message_callback'] = None
+        _message_callback = None
 
 def set_queued_noteon_callback(callback):
     """Set the queued MIDI note on callback."""
+    global _noteon_callback
     if callable(callback):
-        CALLBACKS['noteon_callback'] = callback
+        _noteon_callback = callback
         libpd.libpd_set_queued_noteonhook(noteon_callback_hook)
     else:
-        CALLBACKS['noteon_callback'] = None
+        _noteon_callback = None
 
 def set_queued_controlchange_callback(callback):
     """Set the queued MIDI control change callback."""
+    global _controlchange_callback
     if callable(callback):
-        CALLBACKS['controlchange_callback'] = callback
+        _controlchange_callback = callback
         libpd.libpd_set_queued_controlchangehook(controlchange_callback_hook)
     else:
-        CALLBACKS['controlchange_callback'] = None
+        _controlchange_callback = None
 
 def set_queued_programchange_callback(callback):
     """Set the queued MIDI program change callback."""
+    global _programchange_callback
     if callable(callback):
-        CALLBACKS['programchange_callback'] = callback
+        _programchange_callback = callback
         libpd.libpd_set_queued_programchangehook(programchange_callback_hook)
     else:
-        CALLBACKS['programchange_callback'] = None
+        _programchange_callback = None
 
 def set_queued_pitchbend_callback(callback):
     """Set the queued MIDI pitch bend callback."""
+    global _pitchbend_callback
     if callable(callback):
-        CALLBACKS['pitchbend_callback'] = callback
+        _pitchbend_callback = callback
         libpd.libpd_set_queued_pitchbendhook(pitchbend_callback_hook)
     else:
-        CALLBACKS['pitchbend_callback'] = None
+        _pitchbend_callback = None
 
 def set_queued_aftertouch_callback(callback):
     """Set the queued MIDI aftertouch callback."""
+    global _aftertouch_callback
     if callable(callback):
-        CALLBACKS['aftertouch_callback'] = callback
+        _aftertouch_callback = callback
         libpd.libpd_set_queued_aftertouchhook(aftertouch_callback_hook)
     else:
-        CALLBACKS['aftertouch_callback'] = None
+        _aftertouch_callback = None
 
 def set_queued_polyaftertouch_callback(callback):
     """Set the queued MIDI poly aftertouch callback."""
+    global _polyaftertouch_callback
     if callable(callback):
-        CALLBACKS['polyaftertouch_callback'] = callback
+        _polyaftertouch_callback = callback
         libpd.libpd_set_queued_polyaftertouchhook(polyaftertouch_callback_hook)
     else:
-        CALLBACKS['polyaftertouch_callback'] = None
+        _polyaftertouch_callback = None
 
 def set_queued_midibyte_callback(callback):
     """Set the queued MIDI byte callback."""
+    global _midibyte_callback
     if callable(callback):
-        CALLBACKS['midibyte_callback'] = callback
+        _midibyte_callback = callback
         libpd.libpd_set_queued_midibytehook(midibyte_callback_hook)
     else:
-        CALLBACKS['midibyte_callback'] = None
+        _midibyte_callback = None
 
 def queued_init() -> bool:
     """Initialize libpd and the queued ringbuffers.
@@ -893,3 +1135,15 @@ def queued_receive_pd_messages():
 def queued_receive_midi_messages():
     """Process and dispatch received MIDI messages in MIDI ringbuffer."""
     libpd.libpd_queued_receive_midi_messages()
+
+def queued_receive():
+    """Process and dispatch both the message and MIDI ringbuffers.
+
+    Equivalent to calling queued_receive_pd_messages() and
+    queued_receive_midi_messages(), but in a single call, which halves the
+    Python call overhead of a tight polling loop. The underlying buffers
+    are libpd's lock-free single-producer/single-consumer ringbuffers, so
+    draining is safe while the audio thread is producing.
+    """
+    libpd.libpd_queued_receive_pd_messages()
+    libpd.libpd_queued_receive_midi_messages()
@@ -141,3 +141,26 @@ cdef extern from *:
     void ma_device_config_set_capture(ma_device_config* config,
                                        ma_format format,
                                        ma_uint32 channels) nogil
+
+
+# Millisecond sleep helper
+# miniaudio's own ma_sleep() is private to the implementation file, so we
+# provide an equivalent here for use without holding the GIL
+cdef extern from *:
+    """
+    #ifdef _WIN32
+    #include <windows.h>
+    static void ma_sleep_ms(unsigned int milliseconds) {
+        Sleep(milliseconds);
+    }
+    #else
+    #include <time.h>
+    static void ma_sleep_ms(unsigned int milliseconds) {
+        struct timespec ts;
+        ts.tv_sec  = milliseconds / 1000;
+        ts.tv_nsec = (long)(milliseconds % 1000) * 1000000L;
+        nanosleep(&ts, NULL);
+    }
+    #endif
+    """
+    void ma_sleep_ms(unsigned int milliseconds) nogil
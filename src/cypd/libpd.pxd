@@ -9,38 +9,38 @@ cdef extern from "pd/z_libpd.h":
     # returns 0 on success or -1 if libpd was already initialized
     # note: sets SIGFPE handler to keep bad pd patches from crashing due to divide
     #       by 0, set any custom handling after calling this function
-    int libpd_init()
+    int libpd_init() nogil
 
     # clear the libpd search path for abstractions and externals
     # note: this is called by libpd_init()
-    void libpd_clear_search_path()
+    void libpd_clear_search_path() nogil
 
     # add a path to the libpd search paths
     # relative paths are relative to the current working directory
     # unlike desktop pd, *no* search paths are set by default (ie. extra)
-    void libpd_add_to_search_path(const char *path)
+    void libpd_add_to_search_path(const char *path) nogil
 
 ## opening patches
 
     # open a patch by filename and parent dir path
     # returns an opaque patch handle pointer or NULL on failure
-    void *libpd_openfile(const char *name, const char *dir)
+    void *libpd_openfile(const char *name, const char *dir) nogil
 
     # close a patch by patch handle pointer
     void libpd_closefile(void *p) nogil
 
     # get the $0 id of the patch handle pointer
     # returns $0 value or 0 if the patch is non-existent
-    int libpd_getdollarzero(void *p)
+    int libpd_getdollarzero(void *p) nogil
 
 ## audio processing
 
     # return pd's fixed block size: the number of sample frames per 1 pd tick
-    int libpd_blocksize()
+    int libpd_blocksize() nogil
 
     # initialize audio rendering
     # returns 0 on success
-    int libpd_init_audio(int inChannels, int outChannels, int sampleRate)
+    int libpd_init_audio(int inChannels, int outChannels, int sampleRate) nogil
 
     # process interleaved float samples from inBuffer -> libpd -> outBuffer
     # buffer sizes are based on # of ticks and channels where:
@@ -92,23 +92,23 @@ cdef extern from "pd/z_libpd.h":
 
     # get the size of an array by name
     # returns size or negative error code if non-existent
-    int libpd_arraysize(const char *name)
+    int libpd_arraysize(const char *name) nogil
 
     # (re)size an array by name sizes <= 0 are clipped to 1
     # returns 0 on success or negative error code if non-existent
-    int libpd_resize_array(const char *name, long size)
+    int libpd_resize_array(const char *name, long size) nogil
 
     # read n values from named src array and write into dest starting at an offset
     # note: performs no bounds checking on dest
     # returns 0 on success or a negative error code if the array is non-existent
     # or offset + n exceeds range of array
-    int libpd_read_array(float *dest, const char *name, int offset, int n)
+    int libpd_read_array(float *dest, const char *name, int offset, int n) nogil
 
     # read n values from src and write into named dest array starting at an offset
     # note: performs no bounds checking on src
     # returns 0 on success or a negative error code if the array is non-existent
     # or offset + n exceeds range of array
-    int libpd_write_array(const char *name, int offset, const float *src, int n)
+    int libpd_write_array(const char *name, int offset, const float *src, int n) nogil
 
     # read n values from named src array and write into dest starting at an offset
     # note: performs no bounds checking on dest
@@ -116,7 +116,7 @@ cdef extern from "pd/z_libpd.h":
     # returns 0 on success or a negative error code if the array is non-existent
     # or offset + n exceeds range of array
     # double-precision variant of libpd_read_array()
-    int libpd_read_array_double(double *dest, const char *src, int offset, int n)
+    int libpd_read_array_double(double *dest, const char *src, int offset, int n) nogil
 
     # read n values from src and write into named dest array starting at an offset
     # note: performs no bounds checking on src
@@ -124,30 +124,30 @@ cdef extern from "pd/z_libpd.h":
     # returns 0 on success or a negative error code if the array is non-existent
     # or offset + n exceeds range of array
     # double-precision variant of libpd_write_array()
-    int libpd_write_array_double(const char *dest, int offset, const double *src, int n)
+    int libpd_write_array_double(const char *dest, int offset, const double *src, int n) nogil
 
 ## sending messages to pd
 
     # send a bang to a destination receiver
     # ex: libpd_bang("foo") will send a bang to [s foo] on the next tick
     # returns 0 on success or -1 if receiver name is non-existent
-    int libpd_bang(const char *recv)
+    int libpd_bang(const char *recv) nogil
 
     # send a float to a destination receiver
     # ex: libpd_float("foo", 1) will send a 1.0 to [s foo] on the next tick
     # returns 0 on success or -1 if receiver name is non-existent
-    int libpd_float(const char *recv, float x)
+    int libpd_float(const char *recv, float x) nogil
     
     # send a double to a destination receiver
     # ex: libpd_double("foo", 1.1) will send a 1.1 to [s foo] on the next tick
     # note: only full-precision when compiled with PD_FLOATSIZE=64
     # returns 0 on success or -1 if receiver name is non-existent
-    int libpd_double(const char *recv, double x)
+    int libpd_double(const char *recv, double x) nogil
 
     # send a symbol to a destination receiver
     # ex: libpd_symbol("foo", "bar") will send "bar" to [s foo] on the next tick
     # returns 0 on success or -1 if receiver name is non-existent
-    int libpd_symbol(const char *recv, const char *symbol)
+    int libpd_symbol(const char *recv, const char *symbol) nogil
 
 ## sending compound messages: sequenced function calls
 
@@ -155,17 +155,17 @@ cdef extern from "pd/z_libpd.h":
     # messages can be of a smaller length as max length is only an upper bound
     # note: no cleanup is required for unfinished messages
     # returns 0 on success or nonzero if the length is too large
-    int libpd_start_message(int maxlen)
+    int libpd_start_message(int maxlen) nogil
 
     # add a float to the current message in progress
-    void libpd_add_float(float x)
+    void libpd_add_float(float x) nogil
 
     # add a double to the current message in progress
     # note: only full-precision when compiled with PD_FLOATSIZE=64
-    void libpd_add_double(double x)
+    void libpd_add_double(double x) nogil
 
     # add a symbol to the current message in progress
-    void libpd_add_symbol(const char *symbol)
+    void libpd_add_symbol(const char *symbol) nogil
 
     # finish current message and send as a list to a destination receiver
     # returns 0 on success or -1 if receiver name is non-existent
@@ -175,7 +175,7 @@ cdef extern from "pd/z_libpd.h":
     #     libpd_add_float(2)
     #     libpd_add_symbol("bar")
     #     libpd_finish_list("foo")
-    int libpd_finish_list(const char *recv)
+    int libpd_finish_list(const char *recv) nogil
 
     # finish current message and send as a typed message to a destination receiver
     # note: typed message handling currently only supports up to 4 elements
@@ -185,20 +185,20 @@ cdef extern from "pd/z_libpd.h":
     #     libpd_start_message(1)
     #     libpd_add_float(1)
     #     libpd_finish_message("pd", "dsp")
-    int libpd_finish_message(const char *recv, const char *msg)
+    int libpd_finish_message(const char *recv, const char *msg) nogil
 
 
 ## sending compound messages: atom array
 
     # write a float value to the given atom
-    void libpd_set_float(pd.t_atom *a, float x)
+    void libpd_set_float(pd.t_atom *a, float x) nogil
 
     # write a double value to the given atom
     # note: only full-precision when compiled with PD_FLOATSIZE=64
-    void libpd_set_double(pd.t_atom *v, double x)
+    void libpd_set_double(pd.t_atom *v, double x) nogil
 
     # write a symbol value to the given atom
-    void libpd_set_symbol(pd.t_atom *a, const char *symbol)
+    void libpd_set_symbol(pd.t_atom *a, const char *symbol) nogil
 
     # send an atom array of a given length as a list to a destination receiver
     # returns 0 on success or -1 if receiver name is non-existent
@@ -208,7 +208,7 @@ cdef extern from "pd/z_libpd.h":
     #     libpd_set_float(v + 1, 2)
     #     libpd_set_symbol(v + 2, "bar")
     #     libpd_list("foo", 3, v)
-    int libpd_list(const char *recv, int argc, pd.t_atom *argv)
+    int libpd_list(const char *recv, int argc, pd.t_atom *argv) nogil
 
     # send a atom array of a given length as a typed message to a destination
     # receiver, returns 0 on success or -1 if receiver name is non-existent
@@ -216,7 +216,7 @@ cdef extern from "pd/z_libpd.h":
     #     pd.t_atom v[1]
     #     libpd_set_float(v, 1)
     #     libpd_message("pd", "dsp", 1, v)
-    int libpd_message(const char *recv, const char *msg, int argc, pd.t_atom *argv)
+    int libpd_message(const char *recv, const char *msg, int argc, pd.t_atom *argv) nogil
 
 ## receiving messages from pd
 
@@ -224,14 +224,14 @@ cdef extern from "pd/z_libpd.h":
     # ex: libpd_bind("foo") adds a "virtual" [r foo] which forwards messages to
     #     the libpd message hooks
     # returns an opaque receiver pointer or NULL on failure
-    void *libpd_bind(const char *recv)
+    void *libpd_bind(const char *recv) nogil
 
     # unsubscribe and free a source receiver object created by libpd_bind()
-    void libpd_unbind(void *p)
+    void libpd_unbind(void *p) nogil
 
     # check if a source receiver object exists with a given name
     # returns 1 if the receiver exists, otherwise 0
-    int libpd_exists(const char *recv)
+    int libpd_exists(const char *recv) nogil
 
     # print receive hook signature, s is the string to be printed
     # note: default behavior returns individual words and spaces:
@@ -290,15 +290,15 @@ cdef extern from "pd/z_libpd.h":
 
     # set the print receiver hook, prints to stdout by default
     # note: do not call this while DSP is running
-    void libpd_set_printhook(const t_libpd_printhook hook)
+    void libpd_set_printhook(const t_libpd_printhook hook) nogil
 
     # set the bang receiver hook, NULL by default
     # note: do not call this while DSP is running
-    void libpd_set_banghook(const t_libpd_banghook hook)
+    void libpd_set_banghook(const t_libpd_banghook hook) nogil
 
     # set the float receiver hook, NULL by default
     # note: do not call this while DSP is running
-    void libpd_set_floathook(const t_libpd_floathook hook)
+    void libpd_set_floathook(const t_libpd_floathook hook) nogil
 
     # set the double receiver hook, NULL by default
     # note: avoid calling this while DSP is running
@@ -306,44 +306,44 @@ cdef extern from "pd/z_libpd.h":
     #       hook (see above), but not both.
     #       calling this, will automatically unset the float receiver hook
     # note: only full-precision when compiled with PD_FLOATSIZE=64
-    void libpd_set_doublehook(const t_libpd_doublehook hook)
+    void libpd_set_doublehook(const t_libpd_doublehook hook) nogil
 
     # set the symbol receiver hook, NULL by default
     # note: do not call this while DSP is running
-    void libpd_set_symbolhook(const t_libpd_symbolhook hook)
+    void libpd_set_symbolhook(const t_libpd_symbolhook hook) nogil
 
     # set the list receiver hook, NULL by default
     # note: do not call this while DSP is running
-    void libpd_set_listhook(const t_libpd_listhook hook)
+    void libpd_set_listhook(const t_libpd_listhook hook) nogil
 
     # set the message receiver hook, NULL by default
     # note: do not call this while DSP is running
-    void libpd_set_messagehook(const t_libpd_messagehook hook)
+    void libpd_set_messagehook(const t_libpd_messagehook hook) nogil
 
     # check if an atom is a float type: 0 or 1
     # note: no NULL check is performed
-    int libpd_is_float(pd.t_atom *a)
+    int libpd_is_float(pd.t_atom *a) nogil
 
     # check if an atom is a symbol type: 0 or 1
     # note: no NULL check is performed
-    int libpd_is_symbol(pd.t_atom *a)
+    int libpd_is_symbol(pd.t_atom *a) nogil
 
     # get the float value of an atom
     # note: no NULL or type checks are performed
-    float libpd_get_float(pd.t_atom *a)
+    float libpd_get_float(pd.t_atom *a) nogil
 
     # returns the double value of an atom
     # note: no NULL or type checks are performed
     # note: only full-precision when compiled with PD_FLOATSIZE=64
-    double libpd_get_double(pd.t_atom *a)
+    double libpd_get_double(pd.t_atom *a) nogil
 
     # note: no NULL or type checks are performed
     # get symbol value of an atom
-    const char *libpd_get_symbol(pd.t_atom *a)
+    const char *libpd_get_symbol(pd.t_atom *a) nogil
 
     # increment to the next atom in an atom vector
     # returns next atom or NULL, assuming the atom vector is NULL-terminated
-    pd.t_atom *libpd_next_atom(pd.t_atom *a)
+    pd.t_atom *libpd_next_atom(pd.t_atom *a) nogil
 
 ## sending MIDI messages to pd
 
@@ -352,53 +352,53 @@ cdef extern from "pd/z_libpd.h":
     # channels encode MIDI ports via: libpd_channel = pd_channel + 16 * pd_port
     # note: there is no note off message, send a note on with velocity = 0 instead
     # returns 0 on success or -1 if an argument is out of range
-    int libpd_noteon(int channel, int pitch, int velocity)
+    int libpd_noteon(int channel, int pitch, int velocity) nogil
 
     # send a MIDI control change message to [ctlin] objects
     # channel is 0-indexed, controller is 0-127, and value is 0-127
     # channels encode MIDI ports via: libpd_channel = pd_channel + 16 * pd_port
     # returns 0 on success or -1 if an argument is out of range
-    int libpd_controlchange(int channel, int controller, int value)
+    int libpd_controlchange(int channel, int controller, int value) nogil
 
     # send a MIDI program change message to [pgmin] objects
     # channel is 0-indexed and value is 0-127
     # channels encode MIDI ports via: libpd_channel = pd_channel + 16 * pd_port
     # returns 0 on success or -1 if an argument is out of range
-    int libpd_programchange(int channel, int value)
+    int libpd_programchange(int channel, int value) nogil
 
     # send a MIDI pitch bend message to [bendin] objects
     # channel is 0-indexed and value is -8192-8192
     # channels encode MIDI ports via: libpd_channel = pd_channel + 16 * pd_port
     # note: [bendin] outputs 0-16383 while [bendout] accepts -8192-8192
     # returns 0 on success or -1 if an argument is out of range
-    int libpd_pitchbend(int channel, int value)
+    int libpd_pitchbend(int channel, int value) nogil
 
     # send a MIDI after touch message to [touchin] objects
     # channel is 0-indexed and value is 0-127
     # channels encode MIDI ports via: libpd_channel = pd_channel + 16 * pd_port
     # returns 0 on success or -1 if an argument is out of range
-    int libpd_aftertouch(int channel, int value)
+    int libpd_aftertouch(int channel, int value) nogil
 
     # send a MIDI poly after touch message to [polytouchin] objects
     # channel is 0-indexed, pitch is 0-127, and value is 0-127
     # channels encode MIDI ports via: libpd_channel = pd_channel + 16 * pd_port
     # returns 0 on success or -1 if an argument is out of range
-    int libpd_polyaftertouch(int channel, int pitch, int value)
+    int libpd_polyaftertouch(int channel, int pitch, int value) nogil
 
     # send a raw MIDI byte to [midiin] objects
     # port is 0-indexed and byte is 0-256
     # returns 0 on success or -1 if an argument is out of range
-    int libpd_midibyte(int port, int byte)
+    int libpd_midibyte(int port, int byte) nogil
 
     # send a raw MIDI byte to [sysexin] objects
     # port is 0-indexed and byte is 0-256
     # returns 0 on success or -1 if an argument is out of range
-    int libpd_sysex(int port, int byte)
+    int libpd_sysex(int port, int byte) nogil
 
     # send a raw MIDI byte to [realtimein] objects
     # port is 0-indexed and byte is 0-256
     # returns 0 on success or -1 if an argument is out of range
-    int libpd_sysrealtime(int port, int byte)
+    int libpd_sysrealtime(int port, int byte) nogil
 
 ## receiving MIDI messages from pd
 
@@ -447,37 +447,37 @@ cdef extern from "pd/z_libpd.h":
 
     # set the MIDI note on hook to receive from [noteout] objects, NULL by default
     # note: do not call this while DSP is running
-    void libpd_set_noteonhook(const t_libpd_noteonhook hook)
+    void libpd_set_noteonhook(const t_libpd_noteonhook hook) nogil
 
     # set the MIDI control change hook to receive from [ctlout] objects,
     # NULL by default
     # note: do not call this while DSP is running
-    void libpd_set_controlchangehook(const t_libpd_controlchangehook hook)
+    void libpd_set_controlchangehook(const t_libpd_controlchangehook hook) nogil
 
     # set the MIDI program change hook to receive from [pgmout] objects,
     # NULL by default
     # note: do not call this while DSP is running
-    void libpd_set_programchangehook(const t_libpd_programchangehook hook)
+    void libpd_set_programchangehook(const t_libpd_programchangehook hook) nogil
 
     # set the MIDI pitch bend hook to receive from [bendout] objects,
     # NULL by default
     # note: do not call this while DSP is running
-    void libpd_set_pitchbendhook(const t_libpd_pitchbendhook hook)
+    void libpd_set_pitchbendhook(const t_libpd_pitchbendhook hook) nogil
 
     # set the MIDI after touch hook to receive from [touchout] objects,
     # NULL by default
     # note: do not call this while DSP is running
-    void libpd_set_aftertouchhook(const t_libpd_aftertouchhook hook)
+    void libpd_set_aftertouchhook(const t_libpd_aftertouchhook hook) nogil
 
     # set the MIDI poly after touch hook to receive from [polytouchout] objects,
     # NULL by default
     # note: do not call this while DSP is running
-    void libpd_set_polyaftertouchhook(const t_libpd_polyaftertouchhook hook)
+    void libpd_set_polyaftertouchhook(const t_libpd_polyaftertouchhook hook) nogil
 
     # set the raw MIDI byte hook to receive from [midiout] objects,
     # NULL by default
     # note: do not call this while DSP is running
-    void libpd_set_midibytehook(const t_libpd_midibytehook hook)
+    void libpd_set_midibytehook(const t_libpd_midibytehook hook) nogil
 
 ## GUI
 
@@ -485,10 +485,10 @@ cdef extern from "pd/z_libpd.h":
     # requires the path to pd's main folder that contains bin/, tcl/, etc
     # for a macOS .app bundle: /path/to/Pd-#.#-#.app/Contents/Resources
     # returns 0 on success
-    int libpd_start_gui(const char *path)
+    int libpd_start_gui(const char *path) nogil
 
     # stop the pd vanilla GUI
-    void libpd_stop_gui()
+    void libpd_stop_gui() nogil
 
     # manually update and handle any GUI messages
     # this is called automatically when using a libpd_process function,
@@ -496,25 +496,25 @@ cdef extern from "pd/z_libpd.h":
     #       useful to call repeatedly when idle for more throughput
     # returns 1 if the poll found something, in which case it might be desirable
     # to poll again, up to some reasonable limit
-    int libpd_poll_gui()
+    int libpd_poll_gui() nogil
 
 ## multiple instances
 
     # create a new pd instance
     # returns new instance or NULL when libpd is not compiled with PDINSTANCE
-    pd.t_pdinstance *libpd_new_instance()
+    pd.t_pdinstance *libpd_new_instance() nogil
 
     # set the current pd instance
     # subsequent libpd calls will affect this instance only
     # does nothing when libpd is not compiled with PDINSTANCE
-    void libpd_set_instance(pd.t_pdinstance *p)
+    void libpd_set_instance(pd.t_pdinstance *p) nogil
 
     # free a pd instance
     # does nothing when libpd is not compiled with PDINSTANCE
-    void libpd_free_instance(pd.t_pdinstance *p)
+    void libpd_free_instance(pd.t_pdinstance *p) nogil
 
     # get the current pd instance
-    pd.t_pdinstance *libpd_this_instance()
+    pd.t_pdinstance *libpd_this_instance() nogil
 
     # get a pd instance by index
     # returns NULL if index is out of bounds or "this" instance when libpd is not
@@ -524,26 +524,26 @@ cdef extern from "pd/z_libpd.h":
 
     # get the number of pd instances
     # returns number or 1 when libpd is not compiled with PDINSTANCE
-    int libpd_num_instances()
+    int libpd_num_instances() nogil
 
 ## log level
 
     # set verbose print state: 0 or 1
-    void libpd_set_verbose(int verbose)
+    void libpd_set_verbose(int verbose) nogil
 
     # get the verbose print state: 0 or 1
-    int libpd_get_verbose()
+    int libpd_get_verbose() nogil
 
 
 cdef extern from "pd/z_queued.h":
 
     # set the queued print receiver hook, NULL by default
     # note: do not call this while DSP is running
-    cdef void libpd_set_queued_printhook(const t_libpd_printhook hook)
+    cdef void libpd_set_queued_printhook(const t_libpd_printhook hook) nogil
 
     # set the queued bang receiver hook, NULL by default
     # note: do not call this while DSP is running
-    cdef void libpd_set_queued_banghook(const t_libpd_banghook hook)
+    cdef void libpd_set_queued_banghook(const t_libpd_banghook hook) nogil
 
     # set the queued float receiver hook, NULL by default
     # note: avoid calling this while DSP is running
@@ -551,7 +551,7 @@ cdef extern from "pd/z_queued.h":
     #       double receiver hook (see below), but not both.
     #       calling this, will automatically unset the queued double receiver
     #       hook
-    cdef void libpd_set_queued_floathook(const t_libpd_floathook hook)
+    cdef void libpd_set_queued_floathook(const t_libpd_floathook hook) nogil
 
     # set the queued double receiver hook, NULL by default
     # note: avoid calling this while DSP is running
@@ -559,62 +559,62 @@ cdef extern from "pd/z_queued.h":
     #       float receiver hook (see above), but not both.
     #       calling this, will automatically unset the queued float receiver
     #       hook
-    cdef void libpd_set_queued_doublehook(const t_libpd_doublehook hook)
+    cdef void libpd_set_queued_doublehook(const t_libpd_doublehook hook) nogil
 
     # set the queued symbol receiver hook, NULL by default
     # note: do not call this while DSP is running
-    cdef void libpd_set_queued_symbolhook(const t_libpd_symbolhook hook)
+    cdef void libpd_set_queued_symbolhook(const t_libpd_symbolhook hook) nogil
 
     # set the queued list receiver hook, NULL by default
     # note: do not call this while DSP is running
-    cdef void libpd_set_queued_listhook(const t_libpd_listhook hook)
+    cdef void libpd_set_queued_listhook(const t_libpd_listhook hook) nogil
 
     # set the queued typed message receiver hook, NULL by default
     # note: do not call this while DSP is running
-    cdef void libpd_set_queued_messagehook(const t_libpd_messagehook hook)
+    cdef void libpd_set_queued_messagehook(const t_libpd_messagehook hook) nogil
 
     # set the queued MIDI note on hook, NULL by default
     # note: do not call this while DSP is running
-    cdef void libpd_set_queued_noteonhook(const t_libpd_noteonhook hook)
+    cdef void libpd_set_queued_noteonhook(const t_libpd_noteonhook hook) nogil
 
     # set the queued MIDI control change hook, NULL by default
     # note: do not call this while DSP is running
-    cdef void libpd_set_queued_controlchangehook(const t_libpd_controlchangehook hook)
+    cdef void libpd_set_queued_controlchangehook(const t_libpd_controlchangehook hook) nogil
 
     # set the queued MIDI program change hook, NULL by default
     # note: do not call this while DSP is running
-    cdef void libpd_set_queued_programchangehook(const t_libpd_programchangehook hook)
+    cdef void libpd_set_queued_programchangehook(const t_libpd_programchangehook hook) nogil
 
     # set the queued MIDI pitch bend hook, NULL by default
     # note: do not call this while DSP is running
-    cdef void libpd_set_queued_pitchbendhook(const t_libpd_pitchbendhook hook)
+    cdef void libpd_set_queued_pitchbendhook(const t_libpd_pitchbendhook hook) nogil
 
     # set the queued MIDI after touch hook, NULL by default
     # note: do not call this while DSP is running
-    cdef void libpd_set_queued_aftertouchhook(const t_libpd_aftertouchhook hook)
+    cdef void libpd_set_queued_aftertouchhook(const t_libpd_aftertouchhook hook) nogil
 
     # set the queued MIDI poly after touch hook, NULL by default
     # note: do not call this while DSP is running
-    cdef void libpd_set_queued_polyaftertouchhook(const t_libpd_polyaftertouchhook hook)
+    cdef void libpd_set_queued_polyaftertouchhook(const t_libpd_polyaftertouchhook hook) nogil
 
     # set the queued raw MIDI byte hook, NULL by default
     # note: do not call this while DSP is running
-    cdef void libpd_set_queued_midibytehook(const t_libpd_midibytehook hook)
+    cdef void libpd_set_queued_midibytehook(const t_libpd_midibytehook hook) nogil
 
     # initialize libpd and the queued ringbuffers, use in place of libpd_init()
     # this is safe to call more than once
     # returns 0 on success, -1 if libpd was already initialized, or -2 if ring
     # buffer allocation failed
-    cdef int libpd_queued_init()
+    cdef int libpd_queued_init() nogil
 
     # free the queued ringbuffers
-    cdef void libpd_queued_release()
+    cdef void libpd_queued_release() nogil
 
     # process and dispatch received messages in message ringbuffer
-    cdef void libpd_queued_receive_pd_messages()
+    cdef void libpd_queued_receive_pd_messages() nogil
 
     # process and dispatch receive midi messages in MIDI message ringbuffer
-    cdef void libpd_queued_receive_midi_messages()
+    cdef void libpd_queued_receive_midi_messages() nogil
 
 
 cdef extern from "pd/z_print_util.h":
@@ -627,7 +627,7 @@ cdef extern from "pd/z_print_util.h":
     # ie. line "hello 123" is sent in 3 parts -> "hello", " ", "123\n"
 
     # assign the pointer to your print handler
-    cdef void libpd_set_concatenated_printhook(const t_libpd_printhook hook)
+    cdef void libpd_set_concatenated_printhook(const t_libpd_printhook hook) nogil
 
     # assign this function pointer to libpd_printhook or libpd_queued_printhook,
     # depending on whether you're using queued messages, to intercept and
@@ -638,4 +638,4 @@ cdef extern from "pd/z_print_util.h":
     # note: the char pointer argument is only good for the duration of the print
     #       callback; if you intend to use the argument after the callback has
     #       returned, you need to make a defensive copy
-    cdef void libpd_print_concatenator(const char *s)
+    cdef void libpd_print_concatenator(const char *s) nogil
@@ -83,6 +83,38 @@ def test_message_building():
     assert cypd.finish_list("nonexistent_receiver_12345") is False
 
 
+def test_process_float():
+    """Test zero-copy float processing into a caller-owned buffer."""
+    import array
+    cypd.init()
+    cypd.init_audio(1, 2, 44100)
+    blocksize = cypd.get_blocksize()
+    in_buffer = array.array("f", [0.0] * blocksize)
+    out_buffer = array.array("f", [0.0] * blocksize * 2)
+    assert cypd.process_float(1, in_buffer, out_buffer) == 0
+
+
+def test_send_list_fast():
+    """Test typed-buffer list sending."""
+    import array
+    cypd.init()
+    buf = array.array("d", [1.0, 2.0, 3.0])
+    # finish to nonexistent receiver returns False
+    assert cypd.send_list_fast("nonexistent_receiver_12345", buf) is False
+
+
+def test_sender():
+    """Test pre-bound Sender fast path."""
+    import array
+    cypd.init()
+    sender = cypd.Sender("nonexistent_receiver_12345")
+    assert sender.receiver == "nonexistent_receiver_12345"
+    assert sender.bang() is False
+    assert sender.float(1.0) is False
+    assert sender.symbol("test") is False
+    assert sender.list(array.array("d", [1.0, 2.0])) is False
+
+
 def test_subscribe_unsubscribe():
     """Test subscribe and unsubscribe."""
     cypd.init()
@@ -110,6 +142,15 @@ def test_midi_to_nonexistent():
     assert cypd.aftertouch(0, 64) is True
 
 
+def test_midi_clamping():
+    """Test out-of-range MIDI values are clamped rather than rejected."""
+    cypd.init()
+    assert cypd.noteon(0, 200, 300) is True
+    assert cypd.noteon(-1, -5, -5) is True
+    assert cypd.controlchange(0, 500, -1) is True
+    assert cypd.programchange(0, 200) is True
+
+
 def test_callbacks():
     """Test setting callbacks doesn't crash."""
     cypd.init()